@@ -1,11 +1,17 @@
 from fastmcp import FastMCP, Context
 import twikit
+import httpx
 import os
+import json
+import time
+import asyncio
+import functools
+import operator
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
 import logging
 
-# Create an MCP server
-mcp = FastMCP("mcp-twikit")
 logger = logging.getLogger(__name__)
 httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
@@ -15,111 +21,381 @@ EMAIL = os.getenv('TWITTER_EMAIL')
 PASSWORD = os.getenv('TWITTER_PASSWORD')
 USER_AGENT = os.getenv('USER_AGENT')
 COOKIES_PATH = Path.home() / '.mcp-twikit' / 'cookies.json'
+COOKIES_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+# Without saved cookies or a username/password there is no way to log in
+_HAS_CREDENTIALS = all((USERNAME, PASSWORD))
+_CAN_AUTH = COOKIES_PATH.exists() or _HAS_CREDENTIALS
+NO_CREDENTIALS_MESSAGE = (
+    "No Twitter credentials configured: set TWITTER_USERNAME and TWITTER_PASSWORD "
+    f"or provide saved cookies at {COOKIES_PATH}"
+)
+
+def _log_warmup_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        # Login failures are already logged by _login; a tool call retries
+        logger.debug("Failed to warm up Twitter client: %s", task.exception())
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm up the shared Twitter client on start and release it on shutdown."""
+    # Log in while the MCP handshake runs; early tool calls wait on the
+    # same login via _login_lock instead of starting their own
+    warmup = None
+    if _CAN_AUTH:
+        warmup = asyncio.create_task(get_twitter_client())
+        warmup.add_done_callback(_log_warmup_failure)
+    try:
+        yield
+    finally:
+        if warmup is not None:
+            warmup.cancel()
+        await close_twitter_client()
 
-async def get_twitter_client() -> twikit.Client:
-    """Initialize and return an authenticated Twitter client."""
-    client = twikit.Client('en-US', user_agent=USER_AGENT)
-    
-    if COOKIES_PATH.exists():
-        client.load_cookies(COOKIES_PATH)
-    else:
+# Create an MCP server
+mcp = FastMCP("mcp-twikit", lifespan=lifespan)
+
+# Connection pool settings for the httpx client twikit creates internally
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# How often (seconds) changed cookies are written back to COOKIES_PATH
+COOKIE_FLUSH_INTERVAL = 60
+
+# Shared client, reused across tool calls so cookies and connections persist
+_client: twikit.Client | None = None
+# Serializes logins so concurrent callers share one instead of racing
+_login_lock = asyncio.Lock()
+_login_generation = 0
+# Serializes writes to COOKIES_PATH between the flusher, logins and shutdown
+_cookies_lock = asyncio.Lock()
+_cookies_hash: int | None = None
+_cookie_flusher_task: asyncio.Task | None = None
+
+def _dump_cookies(client: twikit.Client) -> str:
+    return json.dumps(client.get_cookies(), sort_keys=True)
+
+def _write_cookies_file(cookies: str) -> None:
+    # Write to a temporary file and swap it in, so a crash or concurrent
+    # reader never sees a truncated cookies.json
+    tmp_path = COOKIES_PATH.with_suffix('.json.tmp')
+    tmp_path.write_text(cookies)
+    os.replace(tmp_path, COOKIES_PATH)
+
+async def _flush_cookies(client: twikit.Client) -> None:
+    """Write the client's cookies to disk if they changed since the last write."""
+    global _cookies_hash
+    async with _cookies_lock:
+        cookies = _dump_cookies(client)
+        cookies_hash = hash(cookies)
+        if cookies_hash == _cookies_hash:
+            return
+        await asyncio.to_thread(_write_cookies_file, cookies)
+        _cookies_hash = cookies_hash
+
+async def _cookie_flusher(client: twikit.Client) -> None:
+    """Periodically persist cookies refreshed by the server during normal use."""
+    while True:
+        await asyncio.sleep(COOKIE_FLUSH_INTERVAL)
         try:
-            await client.login(
-                auth_info_1=USERNAME,
-                auth_info_2=EMAIL,
-                password=PASSWORD
-            )
+            await _flush_cookies(client)
         except Exception as e:
-            logger.error(f"Failed to login: {e}")
+            logger.error("Failed to save cookies: %s", e)
+
+async def _login(client: twikit.Client) -> None:
+    """Log in with the configured credentials and persist the new cookies."""
+    global _login_generation
+    try:
+        await client.login(
+            auth_info_1=USERNAME,
+            auth_info_2=EMAIL,
+            password=PASSWORD
+        )
+    except Exception as e:
+        logger.error("Failed to login: %s", e)
+        raise
+    await _flush_cookies(client)
+    _login_generation += 1
+
+async def get_twitter_client() -> twikit.Client:
+    """Return the shared authenticated Twitter client, creating it on first use."""
+    global _client, _cookies_hash, _cookie_flusher_task
+    if _client is not None:
+        return _client
+    if not _CAN_AUTH:
+        raise RuntimeError(NO_CREDENTIALS_MESSAGE)
+
+    async with _login_lock:
+        if _client is not None:
+            return _client
+
+        client = twikit.Client(
+            'en-US',
+            user_agent=USER_AGENT,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT
+        )
+
+        # Saved cookies are trusted as-is; an expired session is detected
+        # by the first tool call and handled by _call_with_reauth
+        if await asyncio.to_thread(COOKIES_PATH.exists):
+            try:
+                await asyncio.to_thread(client.load_cookies, COOKIES_PATH)
+            except Exception as e:
+                if not _HAS_CREDENTIALS:
+                    raise RuntimeError(
+                        f"Saved cookies at {COOKIES_PATH} could not be loaded ({e}); "
+                        "replace them or set TWITTER_USERNAME and TWITTER_PASSWORD"
+                    ) from e
+                logger.warning("Failed to load saved cookies, logging in again: %s", e)
+                await _login(client)
+            else:
+                _cookies_hash = hash(_dump_cookies(client))
+        else:
+            await _login(client)
+
+        _cookie_flusher_task = asyncio.create_task(_cookie_flusher(client))
+        _client = client
+        return _client
+
+async def close_twitter_client() -> None:
+    """Save cookies and close the shared Twitter client, if one was created."""
+    global _client, _cookie_flusher_task
+    if _client is None:
+        return
+
+    client, _client = _client, None
+    for task in _prefetch_cache.values():
+        task.cancel()
+    _prefetch_cache.clear()
+    if _cookie_flusher_task is not None:
+        _cookie_flusher_task.cancel()
+        _cookie_flusher_task = None
+    try:
+        await _flush_cookies(client)
+    finally:
+        await client.http.aclose()
+
+async def _call_with_reauth(fn, *args, retry_on_disconnect: bool = False, **kwargs):
+    """Await a client method, retrying once after an expired session or a failed connection.
+
+    A connection that drops mid-request may already have been handled by the
+    server, so that case is only retried for reads that pass
+    `retry_on_disconnect=True`; retrying a write could post it twice.
+    """
+    generation = _login_generation
+    try:
+        return await fn(*args, **kwargs)
+    except twikit.errors.Unauthorized as e:
+        await _relogin(generation, e)
+    except httpx.ConnectError as e:
+        # The request never left the client, so any call is safe to retry;
+        # httpx opens a fresh connection and the cached client is kept
+        logger.info("Twitter connection failed, retrying: %s", e)
+    except httpx.RemoteProtocolError as e:
+        if not retry_on_disconnect:
             raise
-        COOKIES_PATH.parent.mkdir(parents=True, exist_ok=True)
-        client.save_cookies(COOKIES_PATH)
-    
-    return client
+        logger.info("Twitter connection dropped, retrying: %s", e)
+    return await fn(*args, **kwargs)
+
+async def _relogin(generation: int, error: twikit.errors.Unauthorized) -> None:
+    """Log in again, unless another caller already did after `generation` was observed."""
+    if not _HAS_CREDENTIALS:
+        raise twikit.errors.Unauthorized(
+            f"Twitter session expired ({error}); refresh the cookies at {COOKIES_PATH} "
+            "or set TWITTER_USERNAME and TWITTER_PASSWORD"
+        ) from error
+    client = await get_twitter_client()
+    async with _login_lock:
+        if _login_generation != generation:
+            return
+        logger.info("Twitter session expired, logging in again")
+        await _login(client)
+
+def _normalize_handle(username: str) -> str:
+    """Strip a single leading '@' sigil from a Twitter handle."""
+    return username[1:] if username.startswith('@') else username
+
+# screen_name -> (fetched at, user); bounded LRU with a per-entry TTL
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL = 300
+_user_cache: OrderedDict[str, tuple[float, twikit.User]] = OrderedDict()
+
+async def _resolve_user(client: twikit.Client, username: str, ttl: float = USER_CACHE_TTL) -> twikit.User:
+    """Look up a user by screen name, reusing recent lookups of the same handle."""
+    key = username.lower()
+    cached = _user_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        _user_cache.move_to_end(key)
+        return cached[1]
+
+    user = await _call_with_reauth(client.get_user_by_screen_name, username, retry_on_disconnect=True)
+    if user:
+        _user_cache[key] = (time.monotonic(), user)
+        _user_cache.move_to_end(key)
+        if len(_user_cache) > USER_CACHE_SIZE:
+            _user_cache.popitem(last=False)
+    return user
+
+# Background fetches of the page after the last one returned, keyed by
+# (tool, arguments..., cursor) so a follow-up call can pick them up. Only
+# callers already paginating (passing a cursor) get a prefetch, so one-shot
+# calls don't spend Twitter's per-endpoint rate limits on unused pages
+PREFETCH_CACHE_SIZE = 64
+_prefetch_cache: OrderedDict[tuple, asyncio.Task] = OrderedDict()
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # Prefetches nobody asks for should not log "exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+def _prefetch_next(key: tuple, page: twikit.utils.Result) -> None:
+    """Start fetching the page after `page` in the background."""
+    if not page.next_cursor:
+        return
+    task = asyncio.create_task(page.next())
+    task.add_done_callback(_retrieve_exception)
+    _prefetch_cache[key + (page.next_cursor,)] = task
+    if len(_prefetch_cache) > PREFETCH_CACHE_SIZE:
+        _, stale = _prefetch_cache.popitem(last=False)
+        stale.cancel()
+
+async def _fetch_page(key: tuple, fetch, cursor: str | None = None) -> twikit.utils.Result:
+    """Fetch one page of results, reusing a prefetched page for `cursor` if there is one."""
+    page = None
+    task = _prefetch_cache.pop(key + (cursor,), None) if cursor else None
+    if task is not None:
+        try:
+            page = await task
+        except Exception as e:
+            logger.debug("Prefetched page failed, fetching again: %s", e)
+    if page is None:
+        page = await _call_with_reauth(fetch, cursor=cursor, retry_on_disconnect=True)
+    if cursor:
+        _prefetch_next(key, page)
+    return page
+
+def _with_next_cursor(text: str, page: twikit.utils.Result) -> str:
+    if not page.next_cursor:
+        return text
+    return f"{text}\n\nNext cursor: {page.next_cursor}"
+
+def _requires_auth(fn):
+    """Make a tool return NO_CREDENTIALS_MESSAGE straight away when it cannot log in."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if not _CAN_AUTH:
+            return NO_CREDENTIALS_MESSAGE
+        return await fn(*args, **kwargs)
+    return wrapper
+
+async def _get_user(username: str) -> tuple[twikit.Client, twikit.User]:
+    """Return the shared client and the user for a normalized handle."""
+    client = await get_twitter_client()
+    return client, await _resolve_user(client, username)
 
 # Add an addition tool
 @mcp.tool()
-async def search_twitter(query: str, sort_by: str = 'Top', count: int = 10, ctx: Context = None) -> str:
-    """Search twitter with a query. Sort by 'Top' or 'Latest'"""
+@_requires_auth
+async def search_twitter(query: str, sort_by: str = 'Top', count: int = 10, cursor: str | None = None, ctx: Context = None) -> str:
+    """Search twitter with a query. Sort by 'Top' or 'Latest'. Pass the returned cursor to get the next page."""
     try:
         client = await get_twitter_client()
-        tweets = await client.search_tweet(query, product=sort_by, count=count)
-        return convert_tweets_to_markdown(tweets)
+        tweets = await _fetch_page(
+            ('search_twitter', query, sort_by, count),
+            functools.partial(client.search_tweet, query, sort_by, count),
+            cursor
+        )
+        return _with_next_cursor(convert_tweets_to_markdown(tweets), tweets)
     except Exception as e:
-        logger.error(f"Failed to search tweets: {e}")
+        logger.error("Failed to search tweets: %s", e)
         return f"Failed to search tweets: {e}"
 
 @mcp.tool()
-async def get_user_tweets(username: str, tweet_type: str = 'Tweets', count: int = 10, ctx: Context = None) -> str:
+@_requires_auth
+async def get_user_tweets(username: str, tweet_type: str = 'Tweets', count: int = 10, cursor: str | None = None, ctx: Context = None) -> str:
     """Get tweets from a specific user's timeline.
     
     Args:
         username: Twitter username (with or without @)
         tweet_type: Type of tweets to retrieve - 'Tweets', 'Replies', 'Media', or 'Likes'
         count: Number of tweets to retrieve (default 10)
+        cursor: Cursor returned by a previous call, to get the next page
     """
     
     try:
         client = await get_twitter_client()
         
         # Remove @ if present in username
-        username = username.lstrip('@')
+        username = _normalize_handle(username)
         
         # First get user ID from screen name
-        user = await client.get_user_by_screen_name(username)
+        user = await _resolve_user(client, username)
         if not user:
             return f"Could not find user {username}"
             
         # Then get their tweets
-        tweets = await client.get_user_tweets(
-            user_id=user.id,
-            tweet_type=tweet_type,
-            count=count
+        tweets = await _fetch_page(
+            ('get_user_tweets', user.id, tweet_type, count),
+            functools.partial(client.get_user_tweets, user.id, tweet_type, count),
+            cursor
         )
-        return convert_tweets_to_markdown(tweets)
+        return _with_next_cursor(convert_tweets_to_markdown(tweets), tweets)
     except Exception as e:
-        logger.error(f"Failed to get user tweets: {e}")
+        logger.error("Failed to get user tweets: %s", e)
         return f"Failed to get user tweets: {e}"
 
 @mcp.tool()
-async def get_timeline(count: int = 20) -> str:
+@_requires_auth
+async def get_timeline(count: int = 20, cursor: str | None = None) -> str:
     """Get tweets from your home timeline (For You).
     
     Args:
         count: Number of tweets to retrieve (default 20)
+        cursor: Cursor returned by a previous call, to get the next page
     """
     try:
         client = await get_twitter_client()
-        tweets = await client.get_timeline(count=count)
-        return convert_tweets_to_markdown(tweets)
+        tweets = await _fetch_page(
+            ('get_timeline', count),
+            functools.partial(client.get_timeline, count),
+            cursor
+        )
+        return _with_next_cursor(convert_tweets_to_markdown(tweets), tweets)
     except Exception as e:
-        logger.error(f"Failed to get timeline: {e}")
+        logger.error("Failed to get timeline: %s", e)
         return f"Failed to get timeline: {e}"
 
 @mcp.tool() 
-async def get_latest_timeline(count: int = 20) -> str:
+@_requires_auth
+async def get_latest_timeline(count: int = 20, cursor: str | None = None) -> str:
     """Get tweets from your home timeline (Following).
     
     Args:
         count: Number of tweets to retrieve (default 20)
+        cursor: Cursor returned by a previous call, to get the next page
     """
     try:
         client = await get_twitter_client()
-        tweets = await client.get_latest_timeline(count=count)
-        return convert_tweets_to_markdown(tweets)
+        tweets = await _fetch_page(
+            ('get_latest_timeline', count),
+            functools.partial(client.get_latest_timeline, count),
+            cursor
+        )
+        return _with_next_cursor(convert_tweets_to_markdown(tweets), tweets)
     except Exception as e:
-        logger.error(f"Failed to get latest timeline: {e}")
+        logger.error("Failed to get latest timeline: %s", e)
         return f"Failed to get latest timeline: {e}"
 
 
+_TWEET_TMPL = "**@{}** - {}\n{}".format
+_TWEET_FIELDS = operator.attrgetter("user.screen_name", "created_at", "text")
+
 def convert_tweets_to_markdown(tweets: list[twikit.Tweet]) -> str:
-    markdown_tweets = []
-    for tweet in tweets:
-        tweet_text = f"**@{tweet.user.screen_name}** - {tweet.created_at}\n{tweet.text}"
-        markdown_tweets.append(tweet_text)
-    return '\n\n'.join(markdown_tweets)
+    return '\n\n'.join(_TWEET_TMPL(*_TWEET_FIELDS(tweet)) for tweet in tweets)
 
 @mcp.tool()
+@_requires_auth
 async def create_tweet(text: str, media_ids: list[str] | None = None, poll_uri: str | None = None,  ctx: Context = None) -> str:
     """Creates a new tweet.
 
@@ -130,13 +406,14 @@ async def create_tweet(text: str, media_ids: list[str] | None = None, poll_uri:
     """
     try:
         client = await get_twitter_client()
-        tweet = await client.create_tweet(text=text, media_ids=media_ids, poll_uri=poll_uri)
+        tweet = await _call_with_reauth(client.create_tweet, text=text, media_ids=media_ids, poll_uri=poll_uri)
         return f"Tweet created successfully: {tweet.id}"
     except Exception as e:
-        logger.error(f"Failed to create tweet: {e}")
+        logger.error("Failed to create tweet: %s", e)
         return f"Failed to create tweet: {e}"
 
 @mcp.tool()
+@_requires_auth
 async def reply_to_tweet(tweet_id: str, text: str, media_ids: list[str] | None = None, ctx: Context = None) -> str:
     """Replies to a specific tweet.
 
@@ -147,13 +424,14 @@ async def reply_to_tweet(tweet_id: str, text: str, media_ids: list[str] | None =
     """
     try:
         client = await get_twitter_client()
-        tweet = await client.create_tweet(text=text, media_ids=media_ids, reply_to=tweet_id)
+        tweet = await _call_with_reauth(client.create_tweet, text=text, media_ids=media_ids, reply_to=tweet_id)
         return f"Reply sent successfully: {tweet.id}"
     except Exception as e:
-        logger.error(f"Failed to reply to tweet: {e}")
+        logger.error("Failed to reply to tweet: %s", e)
         return f"Failed to reply to tweet: {e}"
 
 @mcp.tool()
+@_requires_auth
 async def like_tweet(tweet_id: str, ctx: Context = None) -> str:
     """Likes a specific tweet.
 
@@ -162,10 +440,10 @@ async def like_tweet(tweet_id: str, ctx: Context = None) -> str:
     """
     try:
         client = await get_twitter_client()
-        await client.favorite_tweet(tweet_id)
+        await _call_with_reauth(client.favorite_tweet, tweet_id)
         return f"Tweet {tweet_id} liked successfully."
     except Exception as e:
-        logger.error(f"Failed to like tweet: {e}")
+        logger.error("Failed to like tweet: %s", e)
         return f"Failed to like tweet: {e}"
 
 # @mcp.tool()
@@ -180,10 +458,11 @@ async def like_tweet(tweet_id: str, ctx: Context = None) -> str:
 #         await client.unfavorite_tweet(tweet_id)
 #         return f"Tweet {tweet_id} unliked successfully."
 #     except Exception as e:
-#         logger.error(f"Failed to unlike tweet: {e}")
+#         logger.error("Failed to unlike tweet: %s", e)
 #         return f"Failed to unlike tweet: {e}"
 
 @mcp.tool()
+@_requires_auth
 async def retweet(tweet_id: str, ctx: Context = None) -> str:
     """Retweets a specific tweet.
 
@@ -192,10 +471,10 @@ async def retweet(tweet_id: str, ctx: Context = None) -> str:
     """
     try:
         client = await get_twitter_client()
-        await client.retweet(tweet_id)
+        await _call_with_reauth(client.retweet, tweet_id)
         return f"Tweet {tweet_id} retweeted successfully."
     except Exception as e:
-        logger.error(f"Failed to retweet: {e}")
+        logger.error("Failed to retweet: %s", e)
         return f"Failed to retweet: {e}"
 
 # @mcp.tool()
@@ -210,10 +489,11 @@ async def retweet(tweet_id: str, ctx: Context = None) -> str:
 #         await client.delete_retweet(tweet_id)
 #         return f"Retweet of tweet {tweet_id} deleted successfully."
 #     except Exception as e:
-#         logger.error(f"Failed to delete retweet: {e}")
+#         logger.error("Failed to delete retweet: %s", e)
 #         return f"Failed to delete retweet: {e}"
 
 @mcp.tool()
+@_requires_auth
 async def follow_user(username: str, ctx: Context = None) -> str:
     """Follows a user.
 
@@ -221,18 +501,18 @@ async def follow_user(username: str, ctx: Context = None) -> str:
         username: The username of the user to follow (with or without @).
     """
     try:
-        client = await get_twitter_client()
-        username = username.lstrip('@')
-        user = await client.get_user_by_screen_name(username)
+        username = _normalize_handle(username)
+        client, user = await _get_user(username)
         if not user:
             return f"Could not find user {username}"
-        await client.follow_user(user.id)
+        await _call_with_reauth(client.follow_user, user.id)
         return f"Successfully followed user {username}"
     except Exception as e:
-        logger.error(f"Failed to follow user: {e}")
+        logger.error("Failed to follow user: %s", e)
         return f"Failed to follow user: {e}"
 
 @mcp.tool()
+@_requires_auth
 async def unfollow_user(username: str, ctx: Context = None) -> str:
     """Unfollows a user.
 
@@ -240,18 +520,94 @@ async def unfollow_user(username: str, ctx: Context = None) -> str:
         username: The username of the user to unfollow (with or without @).
     """
     try:
-        client = await get_twitter_client()
-        username = username.lstrip('@')
-        user = await client.get_user_by_screen_name(username)
+        username = _normalize_handle(username)
+        client, user = await _get_user(username)
         if not user:
             return f"Could not find user {username}"
-        await client.unfollow_user(user.id)
+        await _call_with_reauth(client.unfollow_user, user.id)
         return f"Successfully unfollowed user {username}"
     except Exception as e:
-        logger.error(f"Failed to unfollow user: {e}")
+        logger.error("Failed to unfollow user: %s", e)
         return f"Failed to unfollow user: {e}"
 
+# Upper bound on concurrent follow/unfollow requests made by the bulk tools
+BULK_ACTION_CONCURRENCY = 5
+
+async def _act_on_users(client: twikit.Client, usernames: list[str], action, verb: str) -> str:
+    """Resolve several users and apply a client action to them, a few at a time."""
+    # Screen names are case-insensitive; keep the first spelling of each
+    handles: dict[str, str] = {}
+    for username in usernames:
+        username = _normalize_handle(username)
+        handles.setdefault(username.lower(), username)
+    usernames = list(handles.values())
+    if not usernames:
+        return "No usernames given"
+
+    users = await asyncio.gather(
+        *(_resolve_user(client, username) for username in usernames),
+        return_exceptions=True
+    )
+    targets = [
+        (username, user) for username, user in zip(usernames, users)
+        if user and not isinstance(user, Exception)
+    ]
+    semaphore = asyncio.Semaphore(BULK_ACTION_CONCURRENCY)
+
+    async def act(user: twikit.User):
+        async with semaphore:
+            return await _call_with_reauth(action, user.id)
+
+    results = await asyncio.gather(
+        *(act(user) for _, user in targets),
+        return_exceptions=True
+    )
+    outcomes = dict(zip((username for username, _ in targets), results))
+
+    lines = []
+    for username, user in zip(usernames, users):
+        if isinstance(user, Exception):
+            lines.append(f"  - {username}: failed to look up user: {user}")
+        elif not user:
+            lines.append(f"  - {username}: could not find user")
+        elif isinstance(outcomes[username], Exception):
+            lines.append(f"  - {username}: failed: {outcomes[username]}")
+        else:
+            lines.append(f"  - {username}: {verb}")
+    return "\n".join(lines)
+
+@mcp.tool()
+@_requires_auth
+async def follow_users(usernames: list[str], ctx: Context = None) -> str:
+    """Follows several users at once.
+
+    Args:
+        usernames: The usernames of the users to follow (with or without @).
+    """
+    try:
+        client = await get_twitter_client()
+        return await _act_on_users(client, usernames, client.follow_user, "followed")
+    except Exception as e:
+        logger.error("Failed to follow users: %s", e)
+        return f"Failed to follow users: {e}"
+
+@mcp.tool()
+@_requires_auth
+async def unfollow_users(usernames: list[str], ctx: Context = None) -> str:
+    """Unfollows several users at once.
+
+    Args:
+        usernames: The usernames of the users to unfollow (with or without @).
+    """
+    try:
+        client = await get_twitter_client()
+        return await _act_on_users(client, usernames, client.unfollow_user, "unfollowed")
+    except Exception as e:
+        logger.error("Failed to unfollow users: %s", e)
+        return f"Failed to unfollow users: {e}"
+
 @mcp.tool()
+@_requires_auth
 async def block_user(username: str, ctx: Context = None) -> str:
     """Blocks a user.
 
@@ -259,18 +615,18 @@ async def block_user(username: str, ctx: Context = None) -> str:
         username: The username of the user to block (with or without @).
     """
     try:
-        client = await get_twitter_client()
-        username = username.lstrip('@')
-        user = await client.get_user_by_screen_name(username)
+        username = _normalize_handle(username)
+        client, user = await _get_user(username)
         if not user:
             return f"Could not find user {username}"
-        await client.block_user(user.id)
+        await _call_with_reauth(client.block_user, user.id)
         return f"Successfully blocked user {username}"
     except Exception as e:
-        logger.error(f"Failed to block user: {e}")
+        logger.error("Failed to block user: %s", e)
         return f"Failed to block user: {e}"
 
 @mcp.tool()
+@_requires_auth
 async def unblock_user(username: str, ctx: Context = None) -> str:
     """Unblocks a user.
 
@@ -278,15 +634,14 @@ async def unblock_user(username: str, ctx: Context = None) -> str:
         username: The username of the user to unblock (with or without @).
     """
     try:
-        client = await get_twitter_client()
-        username = username.lstrip('@')
-        user = await client.get_user_by_screen_name(username)
+        username = _normalize_handle(username)
+        client, user = await _get_user(username)
         if not user:
             return f"Could not find user {username}"
-        await client.unblock_user(user.id)
+        await _call_with_reauth(client.unblock_user, user.id)
         return f"Successfully unblocked user {username}"
     except Exception as e:
-        logger.error(f"Failed to unblock user: {e}")
+        logger.error("Failed to unblock user: %s", e)
         return f"Failed to unblock user: {e}"
 
 # @mcp.tool()
@@ -298,14 +653,14 @@ async def unblock_user(username: str, ctx: Context = None) -> str:
 #     """
 #     try:
 #         client = await get_twitter_client()
-#         username = username.lstrip('@')
+#         username = _normalize_handle(username)
 #         user = await client.get_user_by_screen_name(username)
 #         if not user:
 #             return f"Could not find user {username}"
 #         await client.mute_user(user.id)
 #         return f"Successfully muted user {username}"
 #     except Exception as e:
-#         logger.error(f"Failed to mute user: {e}")
+#         logger.error("Failed to mute user: %s", e)
 #         return f"Failed to mute user: {e}"
 
 # @mcp.tool()
@@ -317,85 +672,100 @@ async def unblock_user(username: str, ctx: Context = None) -> str:
 #     """
 #     try:
 #         client = await get_twitter_client()
-#         username = username.lstrip('@')
+#         username = _normalize_handle(username)
 #         user = await client.get_user_by_screen_name(username)
 #         if not user:
 #             return f"Could not find user {username}"
 #         await client.unmute_user(user.id)
 #         return f"Successfully unmuted user {username}"
 #     except Exception as e:
-#         logger.error(f"Failed to unmute user: {e}")
+#         logger.error("Failed to unmute user: %s", e)
 #         return f"Failed to unmute user: {e}"
     
+_USER_INFO_TMPL = (
+    "ID: {id}\n"
+    "Name: {name}\n"
+    "Screen Name: {screen_name}\n"
+    "Description: {description}\n"
+    "Verified: {verified}\n"
+    "Followers Count: {followers_count}\n"
+    "Following Count: {following_count}\n"
+    "Location: {location}\n"
+    "Created At: {created_at}\n"
+    "Profile Image URL: {profile_image_url}\n"
+    "Profile Banner URL: {profile_banner_url}\n"
+).format
+_USER_FIELDS = (
+    'id', 'name', 'screen_name', 'description', 'verified', 'followers_count',
+    'following_count', 'location', 'created_at', 'profile_image_url', 'profile_banner_url',
+)
+
 @mcp.tool()
+@_requires_auth
 async def get_user_by_screen_name(username: str, ctx: Context = None) -> str:
     """
     Retrieves a user by their screen name.
     """
     try:
         client = await get_twitter_client()
-        username = username.lstrip('@')
-        user = await client.get_user_by_screen_name(username)
+        username = _normalize_handle(username)
+        user = await _call_with_reauth(client.get_user_by_screen_name, username, retry_on_disconnect=True)
         if not user:
             return f"Could not find user with screen name {username}"
         
-        user_info = (
-            f"ID: {user.id}\n"
-            f"Name: {user.name}\n"
-            f"Screen Name: {user.screen_name}\n"
-            f"Description: {user.description}\n"
-            f"Verified: {user.verified}\n"
-            f"Followers Count: {user.followers_count}\n"
-            f"Following Count: {user.following_count}\n"
-            f"Location: {user.location}\n"
-            f"Created At: {user.created_at}\n"
-            f"Profile Image URL: {user.profile_image_url}\n"
-            f"Profile Banner URL: {user.profile_banner_url}\n"
-        )
-        return user_info
+        return _USER_INFO_TMPL(**{field: getattr(user, field) for field in _USER_FIELDS})
     except Exception as e:
-        logger.error(f"Failed to retrieve user by screen name: {e}")
+        logger.error("Failed to retrieve user by screen name: %s", e)
         return f"Failed to retrieve user by screen name: {e}"
 
 @mcp.tool()
-async def get_user_followers(username: str, count: int = 20, ctx: Context = None) -> str:
+@_requires_auth
+async def get_user_followers(username: str, count: int = 20, cursor: str | None = None, ctx: Context = None) -> str:
     """
-    Retrieves a list of followers for a given user.
+    Retrieves a list of followers for a given user. Pass the returned cursor to get the next page.
     """
     try:
-        client = await get_twitter_client()
-        username = username.lstrip('@')
-        user = await client.get_user_by_screen_name(username)
+        username = _normalize_handle(username)
+        client, user = await _get_user(username)
         if not user:
             return f"Could not find user {username}"
 
-        followers = await client.get_user_followers(user.id, count=count)
-        followers_info = "\n".join([f"  - @{follower.screen_name} (ID: {follower.id})" for follower in followers])
-        return f"Followers of {username}:\n{followers_info}"
+        followers = await _fetch_page(
+            ('get_user_followers', user.id, count),
+            functools.partial(client.get_user_followers, user.id, count),
+            cursor
+        )
+        followers_info = "\n".join(f"  - @{follower.screen_name} (ID: {follower.id})" for follower in followers)
+        return _with_next_cursor(f"Followers of {username}:\n{followers_info}", followers)
     except Exception as e:
-        logger.error(f"Failed to get followers for user {username}: {e}")
+        logger.error("Failed to get followers for user %s: %s", username, e)
         return f"Failed to get followers for user {username}: {e}"
 
 @mcp.tool()
-async def get_user_following(username: str, count: int = 20, ctx: Context = None) -> str:
+@_requires_auth
+async def get_user_following(username: str, count: int = 20, cursor: str | None = None, ctx: Context = None) -> str:
     """
-    Retrieves a list of users that a given user is following.
+    Retrieves a list of users that a given user is following. Pass the returned cursor to get the next page.
     """
     try:
-        client = await get_twitter_client()
-        username = username.lstrip('@')
-        user = await client.get_user_by_screen_name(username)
+        username = _normalize_handle(username)
+        client, user = await _get_user(username)
         if not user:
             return f"Could not find user {username}"
 
-        following = await client.get_user_following(user.id, count=count)
-        following_info = "\n".join([f"  - @{followed_user.screen_name} (ID: {followed_user.id})" for followed_user in following])
-        return f"Users followed by {username}:\n{following_info}"
+        following = await _fetch_page(
+            ('get_user_following', user.id, count),
+            functools.partial(client.get_user_following, user.id, count),
+            cursor
+        )
+        following_info = "\n".join(f"  - @{followed_user.screen_name} (ID: {followed_user.id})" for followed_user in following)
+        return _with_next_cursor(f"Users followed by {username}:\n{following_info}", following)
     except Exception as e:
-        logger.error(f"Failed to get following list for user {username}: {e}")
+        logger.error("Failed to get following list for user %s: %s", username, e)
         return f"Failed to get following list for user {username}: {e}"
         
 @mcp.tool()
+@_requires_auth
 async def send_dm(user_id: str, text: str, media_id: str | None = None, ctx: Context = None) -> str:
     """Sends a direct message to a user.
 
@@ -406,10 +776,10 @@ async def send_dm(user_id: str, text: str, media_id: str | None = None, ctx: Con
     """
     try:
         client = await get_twitter_client()
-        message = await client.send_dm(user_id, text, media_id=media_id)
+        message = await _call_with_reauth(client.send_dm, user_id, text, media_id=media_id)
         return f"Direct message sent successfully: {message.id}"
     except Exception as e:
-        logger.error(f"Failed to send DM: {e}")
+        logger.error("Failed to send DM: %s", e)
         return f"Failed to send DM: {e}"
 
 # @mcp.tool()
@@ -423,10 +793,10 @@ async def send_dm(user_id: str, text: str, media_id: str | None = None, ctx: Con
 #     try:
 #         client = await get_twitter_client()
 #         messages = await client.get_dm_history(user_id, max_id=max_id)
-#         messages_info = "\n".join([f"  - {message.text} (ID: {message.id})" for message in messages])
+#         messages_info = "\n".join(f"  - {message.text} (ID: {message.id})" for message in messages)
 #         return f"DM history with user {user_id}:\n{messages_info}"
 #     except Exception as e:
-#         logger.error(f"Failed to get DM history: {e}")
+#         logger.error("Failed to get DM history: %s", e)
 #         return f"Failed to get DM history: {e}"
 
 # @mcp.tool()
@@ -444,7 +814,7 @@ async def send_dm(user_id: str, text: str, media_id: str | None = None, ctx: Con
 #         message = await client.send_dm_to_group(group_id, text, media_id=media_id, reply_to=reply_to)
 #         return f"Group message sent successfully: {message.id}"
 #     except Exception as e:
-#         logger.error(f"Failed to send group DM: {e}")
+#         logger.error("Failed to send group DM: %s", e)
 #         return f"Failed to send group DM: {e}"
 
 # @mcp.tool()
@@ -458,10 +828,10 @@ async def send_dm(user_id: str, text: str, media_id: str | None = None, ctx: Con
 #     try:
 #         client = await get_twitter_client()
 #         messages = await client.get_group_dm_history(group_id, max_id=max_id)
-#         messages_info = "\n".join([f"  - {message.text} (ID: {message.id})" for message in messages])
+#         messages_info = "\n".join(f"  - {message.text} (ID: {message.id})" for message in messages)
 #         return f"DM history of group {group_id}:\n{messages_info}"
 #     except Exception as e:
-#         logger.error(f"Failed to get group DM history: {e}")
+#         logger.error("Failed to get group DM history: %s", e)
 #         return f"Failed to get group DM history: {e}"
 
 # @mcp.tool()
@@ -478,7 +848,7 @@ async def send_dm(user_id: str, text: str, media_id: str | None = None, ctx: Con
 #         await client.add_reaction_to_message(message_id, conversation_id, emoji)
 #         return f"Reaction {emoji} added to message {message_id} in conversation {conversation_id}."
 #     except Exception as e:
-#         logger.error(f"Failed to add reaction to message: {e}")
+#         logger.error("Failed to add reaction to message: %s", e)
 #         return f"Failed to add reaction to message: {e}"
         
 # @mcp.tool()
@@ -495,10 +865,11 @@ async def send_dm(user_id: str, text: str, media_id: str | None = None, ctx: Con
 #         await client.remove_reaction_from_message(message_id, conversation_id, emoji)
 #         return f"Reaction {emoji} removed from message {message_id} in conversation {conversation_id}."
 #     except Exception as e:
-#         logger.error(f"Failed to remove reaction from message: {e}")
+#         logger.error("Failed to remove reaction from message: %s", e)
 #         return f"Failed to remove reaction from message: {e}"
 
 @mcp.tool()
+@_requires_auth
 async def get_trends(category: str = 'trending', count: int = 20, ctx: Context = None) -> str:
     """Retrieves trending topics on Twitter.
 
@@ -509,11 +880,11 @@ async def get_trends(category: str = 'trending', count: int = 20, ctx: Context =
     """
     try:
         client = await get_twitter_client()
-        trends = await client.get_trends(category=category, count=count)
-        trends_info = "\n".join([f"  - {trend.name} (Tweets: {trend.tweets_count})" for trend in trends])
+        trends = await _call_with_reauth(client.get_trends, category=category, count=count, retry_on_disconnect=True)
+        trends_info = "\n".join(f"  - {trend.name} (Tweets: {trend.tweets_count})" for trend in trends)
         return f"Trends in {category}:\n{trends_info}"
     except Exception as e:
-        logger.error(f"Failed to get trends: {e}")
+        logger.error("Failed to get trends: %s", e)
         return f"Failed to get trends: {e}"
 
 # @mcp.tool()
@@ -526,9 +897,9 @@ async def get_trends(category: str = 'trending', count: int = 20, ctx: Context =
 #     try:
 #         client = await get_twitter_client()
 #         place_trends = await client.get_place_trends(woeid)
-#         trends_info = "\n".join([f"  - {trend.name} (Volume: {trend.tweet_volume})" for trend in place_trends.trends])
+#         trends_info = "\n".join(f"  - {trend.name} (Volume: {trend.tweet_volume})" for trend in place_trends.trends)
 #         return f"Trends for WOEID {woeid}:\n{trends_info}"
 #     except Exception as e:
-#         logger.error(f"Failed to get place trends: {e}")
+#         logger.error("Failed to get place trends: %s", e)
 #         return f"Failed to get place trends: {e}"
 